@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import cached_property
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import Iterable
@@ -10,6 +11,7 @@ from typing import overload
 
 from narwhals._expression_parsing import evaluate_into_exprs
 from narwhals._pandas_like.expr import PandasLikeExpr
+from narwhals._pandas_like.group_by import PandasLikeGroupBy
 from narwhals._pandas_like.utils import broadcast_series
 from narwhals._pandas_like.utils import convert_str_slice_to_int_slice
 from narwhals._pandas_like.utils import create_native_series
@@ -31,7 +33,6 @@ if TYPE_CHECKING:
     import pandas as pd
     from typing_extensions import Self
 
-    from narwhals._pandas_like.group_by import PandasLikeGroupBy
     from narwhals._pandas_like.namespace import PandasLikeNamespace
     from narwhals._pandas_like.series import PandasLikeSeries
     from narwhals._pandas_like.typing import IntoPandasLikeExpr
@@ -46,8 +47,10 @@ class PandasLikeDataFrame:
         *,
         implementation: Implementation,
         backend_version: tuple[int, ...],
+        validate_column_names: bool = True,
     ) -> None:
-        self._validate_columns(native_dataframe.columns)
+        if validate_column_names:
+            self._validate_columns(native_dataframe.columns)
         self._native_frame = native_dataframe
         self._implementation = implementation
         self._backend_version = backend_version
@@ -59,6 +62,12 @@ class PandasLikeDataFrame:
         return self
 
     def __narwhals_namespace__(self) -> PandasLikeNamespace:
+        return self._namespace
+
+    @cached_property
+    def _namespace(self) -> PandasLikeNamespace:
+        # Namespaces are stateless, so build it once per frame rather than on
+        # every expression evaluation.
         from narwhals._pandas_like.namespace import PandasLikeNamespace
 
         return PandasLikeNamespace(self._implementation, self._backend_version)
@@ -87,11 +96,20 @@ class PandasLikeDataFrame:
             msg = f"Expected unique column names, got: {columns}"
             raise ValueError(msg)
 
-    def _from_native_frame(self, df: Any) -> Self:
+    def _from_native_frame(self, df: Any, *, validate_column_names: bool = True) -> Self:
         return self.__class__(
             df,
             implementation=self._implementation,
             backend_version=self._backend_version,
+            validate_column_names=validate_column_names,
+        )
+
+    def _wrap_columns(self, data: dict[str, Any], index: Any) -> Self:  # pragma: no cover
+        # cuDF-only: build the frame straight from its columns, skipping the
+        # public constructor. Dict keys are unique, so there's nothing to validate.
+        return self._from_native_frame(
+            get_cudf().DataFrame._from_data(data, index=index),
+            validate_column_names=False,
         )
 
     def get_column(self, name: str) -> PandasLikeSeries:
@@ -135,13 +153,7 @@ class PandasLikeDataFrame:
         | tuple[slice, slice],
     ) -> PandasLikeSeries | PandasLikeDataFrame:
         if isinstance(item, str):
-            from narwhals._pandas_like.series import PandasLikeSeries
-
-            return PandasLikeSeries(
-                self._native_frame.loc[:, item],
-                implementation=self._implementation,
-                backend_version=self._backend_version,
-            )
+            return self.get_column(item)
 
         elif (
             isinstance(item, tuple)
@@ -201,7 +213,9 @@ class PandasLikeDataFrame:
         elif is_sequence_but_not_str(item) or (is_numpy_array(item) and item.ndim == 1):
             if all(isinstance(x, str) for x in item) and len(item) > 0:
                 return self._from_native_frame(self._native_frame.loc[:, item])
-            return self._from_native_frame(self._native_frame.iloc[item])
+            return self._from_native_frame(
+                self._native_frame.iloc[item], validate_column_names=False
+            )
 
         elif isinstance(item, slice):
             if isinstance(item.start, str) or isinstance(item.stop, str):
@@ -209,9 +223,12 @@ class PandasLikeDataFrame:
                     item, self._native_frame.columns
                 )
                 return self._from_native_frame(
-                    self._native_frame.iloc[:, slice(start, stop, step)]
+                    self._native_frame.iloc[:, slice(start, stop, step)],
+                    validate_column_names=False,
                 )
-            return self._from_native_frame(self._native_frame.iloc[item])
+            return self._from_native_frame(
+                self._native_frame.iloc[item], validate_column_names=False
+            )
 
         else:  # pragma: no cover
             msg = f"Expected str or slice, got: {type(item)}"
@@ -274,6 +291,16 @@ class PandasLikeDataFrame:
             # return empty dataframe, like Polars does
             return self._from_native_frame(self._native_frame.__class__())
         new_series = broadcast_series(new_series)
+        if (
+            self._implementation is Implementation.CUDF
+            and all(s.index is new_series[0].index for s in new_series)
+            and len({s.name for s in new_series}) == len(new_series)
+        ):  # pragma: no cover
+            # All columns are already aligned, so we can skip `cudf.concat`
+            # (and its per-column metadata pass) and assemble the frame directly.
+            return self._wrap_columns(
+                {s.name: s._column for s in new_series}, index=new_series[0].index
+            )
         df = horizontal_concat(
             new_series,
             implementation=self._implementation,
@@ -283,7 +310,9 @@ class PandasLikeDataFrame:
 
     def drop_nulls(self, subset: str | list[str] | None) -> Self:
         if subset is None:
-            return self._from_native_frame(self._native_frame.dropna(axis=0))
+            return self._from_native_frame(
+                self._native_frame.dropna(axis=0), validate_column_names=False
+            )
         subset = [subset] if isinstance(subset, str) else subset
         plx = self.__narwhals_namespace__()
         return self.filter(~plx.any_horizontal(plx.col(*subset).is_null()))
@@ -322,7 +351,18 @@ class PandasLikeDataFrame:
             # Safety: all_horizontal's expression only returns a single column.
             mask = expr._call(self)[0]
             _mask = validate_dataframe_comparand(self._native_frame.index, mask)
-        return self._from_native_frame(self._native_frame.loc[_mask])
+            if (
+                self._implementation is Implementation.CUDF
+                and getattr(_mask, "index", None) is self._native_frame.index
+            ):  # pragma: no cover
+                # The mask already shares the frame's index, so we can use plain
+                # boolean-mask indexing and skip `.loc`'s label alignment.
+                return self._from_native_frame(
+                    self._native_frame[_mask], validate_column_names=False
+                )
+        return self._from_native_frame(
+            self._native_frame.loc[_mask], validate_column_names=False
+        )
 
     def with_columns(
         self,
@@ -346,7 +386,15 @@ class PandasLikeDataFrame:
             and all(isinstance(x, PandasLikeExpr) for (_, x) in named_exprs.items())
         )
 
-        if fast_path:
+        if fast_path and self._implementation is Implementation.CUDF:  # pragma: no cover
+            # Update the column mapping in one go: existing columns keep their
+            # position, new ones are appended, and no intermediate frames are built.
+            new_data = {
+                s.name: validate_dataframe_comparand(index, s)._column
+                for s in new_columns
+            }
+            return self._wrap_columns({**self._native_frame._data, **new_data}, index)
+        elif fast_path:
             new_column_name_to_new_column_map = {s.name: s for s in new_columns}
             to_concat = []
             # Make sure to preserve column order
@@ -382,7 +430,9 @@ class PandasLikeDataFrame:
         to_drop = parse_columns_to_drop(
             compliant_frame=self, columns=columns, strict=strict
         )
-        return self._from_native_frame(self._native_frame.drop(columns=to_drop))
+        return self._from_native_frame(
+            self._native_frame.drop(columns=to_drop), validate_column_names=False
+        )
 
     # --- transform ---
     def sort(
@@ -391,13 +441,16 @@ class PandasLikeDataFrame:
         *more_by: str,
         descending: bool | Sequence[bool] = False,
     ) -> Self:
-        flat_keys = flatten([*flatten([by]), *more_by])
+        flat_keys = [by, *more_by] if isinstance(by, str) else [*by, *more_by]
         df = self._native_frame
         if isinstance(descending, bool):
             ascending: bool | list[bool] = not descending
         else:
             ascending = [not d for d in descending]
-        return self._from_native_frame(df.sort_values(flat_keys, ascending=ascending))
+        return self._from_native_frame(
+            df.sort_values(flat_keys, ascending=ascending),
+            validate_column_names=False,
+        )
 
     # --- convert ---
     def collect(self) -> PandasLikeDataFrame:
@@ -405,12 +458,11 @@ class PandasLikeDataFrame:
             self._native_frame,
             implementation=self._implementation,
             backend_version=self._backend_version,
+            validate_column_names=False,
         )
 
     # --- actions ---
     def group_by(self, *keys: str) -> PandasLikeGroupBy:
-        from narwhals._pandas_like.group_by import PandasLikeGroupBy
-
         return PandasLikeGroupBy(
             self,
             list(keys),
@@ -512,8 +564,9 @@ class PandasLikeDataFrame:
                 suffixes=("", suffix),
             )
             extra = []
+            columns = self._native_frame.columns
             for left_key, right_key in zip(left_on, right_on):  # type: ignore[arg-type]
-                if right_key != left_key and right_key not in self.columns:
+                if right_key != left_key and right_key not in columns:
                     extra.append(right_key)
                 elif right_key != left_key:
                     extra.append(f"{right_key}{suffix}")
@@ -560,10 +613,14 @@ class PandasLikeDataFrame:
     # --- partial reduction ---
 
     def head(self, n: int) -> Self:
-        return self._from_native_frame(self._native_frame.head(n))
+        return self._from_native_frame(
+            self._native_frame.head(n), validate_column_names=False
+        )
 
     def tail(self, n: int) -> Self:
-        return self._from_native_frame(self._native_frame.tail(n))
+        return self._from_native_frame(
+            self._native_frame.tail(n), validate_column_names=False
+        )
 
     def unique(
         self: Self,
@@ -580,7 +637,8 @@ class PandasLikeDataFrame:
         mapped_keep = {"none": False, "any": "first"}.get(keep, keep)
         subset = flatten(subset) if subset else None
         return self._from_native_frame(
-            self._native_frame.drop_duplicates(subset=subset, keep=mapped_keep)
+            self._native_frame.drop_duplicates(subset=subset, keep=mapped_keep),
+            validate_column_names=False,
         )
 
     # --- lazy-only ---
@@ -592,18 +650,9 @@ class PandasLikeDataFrame:
         return self._native_frame.shape  # type: ignore[no-any-return]
 
     def to_dict(self, *, as_series: bool = False) -> dict[str, Any]:
-        from narwhals._pandas_like.series import PandasLikeSeries
-
         if as_series:
             # TODO(Unassigned): should this return narwhals series?
-            return {
-                col: PandasLikeSeries(
-                    self._native_frame.loc[:, col],
-                    implementation=self._implementation,
-                    backend_version=self._backend_version,
-                )
-                for col in self.columns
-            }
+            return {col: self.get_column(col) for col in self.columns}
         return self._native_frame.to_dict(orient="list")  # type: ignore[no-any-return]
 
     def to_numpy(self, dtype: Any = None, copy: bool | None = None) -> Any:
@@ -665,10 +714,9 @@ class PandasLikeDataFrame:
         )
 
     def null_count(self: Self) -> PandasLikeDataFrame:
-        return PandasLikeDataFrame(
+        return self._from_native_frame(
             self._native_frame.isna().sum(axis=0).to_frame().transpose(),
-            implementation=self._implementation,
-            backend_version=self._backend_version,
+            validate_column_names=False,
         )
 
     def item(self: Self, row: int | None = None, column: int | str | None = None) -> Any:
@@ -686,14 +734,22 @@ class PandasLikeDataFrame:
             msg = "cannot call `.item()` with only one of `row` or `column`"
             raise ValueError(msg)
 
-        _col = self.columns.index(column) if isinstance(column, str) else column
+        _col = (
+            self._native_frame.columns.get_loc(column)
+            if isinstance(column, str)
+            else column
+        )
         return self._native_frame.iloc[row, _col]
 
     def clone(self: Self) -> Self:
-        return self._from_native_frame(self._native_frame.copy())
+        return self._from_native_frame(
+            self._native_frame.copy(), validate_column_names=False
+        )
 
     def gather_every(self: Self, n: int, offset: int = 0) -> Self:
-        return self._from_native_frame(self._native_frame.iloc[offset::n])
+        return self._from_native_frame(
+            self._native_frame.iloc[offset::n], validate_column_names=False
+        )
 
     def to_arrow(self: Self) -> Any:
         if self._implementation is Implementation.CUDF:  # pragma: no cover
@@ -714,5 +770,6 @@ class PandasLikeDataFrame:
         return self._from_native_frame(
             self._native_frame.sample(
                 n=n, frac=fraction, replace=with_replacement, random_state=seed
-            )
+            ),
+            validate_column_names=False,
         )
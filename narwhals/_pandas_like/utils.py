@@ -221,24 +221,24 @@ def set_axis(
 def translate_dtype(column: Any) -> DType:
     from narwhals import dtypes
 
-    dtype = column.dtype
-    if str(dtype) in ("int64", "Int64", "Int64[pyarrow]", "int64[pyarrow]"):
+    dtype = str(column.dtype)
+    if dtype in ("int64", "Int64", "Int64[pyarrow]", "int64[pyarrow]"):
         return dtypes.Int64()
-    if str(dtype) in ("int32", "Int32", "Int32[pyarrow]", "int32[pyarrow]"):
+    if dtype in ("int32", "Int32", "Int32[pyarrow]", "int32[pyarrow]"):
         return dtypes.Int32()
-    if str(dtype) in ("int16", "Int16", "Int16[pyarrow]", "int16[pyarrow]"):
+    if dtype in ("int16", "Int16", "Int16[pyarrow]", "int16[pyarrow]"):
         return dtypes.Int16()
-    if str(dtype) in ("int8", "Int8", "Int8[pyarrow]", "int8[pyarrow]"):
+    if dtype in ("int8", "Int8", "Int8[pyarrow]", "int8[pyarrow]"):
         return dtypes.Int8()
-    if str(dtype) in ("uint64", "UInt64", "UInt64[pyarrow]", "uint64[pyarrow]"):
+    if dtype in ("uint64", "UInt64", "UInt64[pyarrow]", "uint64[pyarrow]"):
         return dtypes.UInt64()
-    if str(dtype) in ("uint32", "UInt32", "UInt32[pyarrow]", "uint32[pyarrow]"):
+    if dtype in ("uint32", "UInt32", "UInt32[pyarrow]", "uint32[pyarrow]"):
         return dtypes.UInt32()
-    if str(dtype) in ("uint16", "UInt16", "UInt16[pyarrow]", "uint16[pyarrow]"):
+    if dtype in ("uint16", "UInt16", "UInt16[pyarrow]", "uint16[pyarrow]"):
         return dtypes.UInt16()
-    if str(dtype) in ("uint8", "UInt8", "UInt8[pyarrow]", "uint8[pyarrow]"):
+    if dtype in ("uint8", "UInt8", "UInt8[pyarrow]", "uint8[pyarrow]"):
         return dtypes.UInt8()
-    if str(dtype) in (
+    if dtype in (
         "float64",
         "Float64",
         "Float64[pyarrow]",
@@ -246,7 +246,7 @@ def translate_dtype(column: Any) -> DType:
         "double[pyarrow]",
     ):
         return dtypes.Float64()
-    if str(dtype) in (
+    if dtype in (
         "float32",
         "Float32",
         "Float32[pyarrow]",
@@ -254,30 +254,30 @@ def translate_dtype(column: Any) -> DType:
         "float[pyarrow]",
     ):
         return dtypes.Float32()
-    if str(dtype) in (
+    if dtype in (
         "string",
         "string[python]",
         "string[pyarrow]",
         "large_string[pyarrow]",
     ):
         return dtypes.String()
-    if str(dtype) in ("bool", "boolean", "boolean[pyarrow]", "bool[pyarrow]"):
+    if dtype in ("bool", "boolean", "boolean[pyarrow]", "bool[pyarrow]"):
         return dtypes.Boolean()
-    if str(dtype) in ("category",) or str(dtype).startswith("dictionary<"):
+    if dtype in ("category",) or dtype.startswith("dictionary<"):
         return dtypes.Categorical()
-    if str(dtype).startswith("datetime64"):
+    if dtype.startswith("datetime64"):
         # TODO(Unassigned): different time units and time zones
         return dtypes.Datetime()
-    if str(dtype).startswith("timedelta64") or str(dtype).startswith("duration"):
+    if dtype.startswith(("timedelta64", "duration")):
         # TODO(Unassigned): different time units
         return dtypes.Duration()
-    if str(dtype).startswith("timestamp["):
+    if dtype.startswith("timestamp["):
         # pyarrow-backed datetime
         # TODO(Unassigned): different time units and time zones
         return dtypes.Datetime()
-    if str(dtype) == "date32[day][pyarrow]":
+    if dtype == "date32[day][pyarrow]":
         return dtypes.Date()
-    if str(dtype) == "object":
+    if dtype == "object":
         if (  # pragma: no cover  TODO(unassigned): why does this show as uncovered?
             idx := getattr(column, "first_valid_index", lambda: None)()
         ) is not None and isinstance(column.loc[idx], str):
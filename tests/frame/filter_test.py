@@ -32,3 +32,15 @@ def test_filter_with_boolean_list(constructor: Constructor) -> None:
         result = df.filter([False, True, True])
         expected = {"a": [3, 2], "b": [4, 6], "z": [8.0, 9.0]}
         compare_dicts(result, expected)
+
+
+def test_filter_keeps_native_type(constructor: Constructor) -> None:
+    # The predicate should be evaluated with the frame's own backend, so that
+    # (e.g.) cuDF inputs are not filtered via pandas.
+    data = {"a": [1, 3, 2], "b": [4, 4, 6]}
+    df_native = constructor(data)
+    df = nw.from_native(df_native)
+    result = df.filter(nw.col("a") > 1, nw.col("b") < 6)
+    assert type(nw.to_native(result)) is type(df_native)
+    assert nw.get_native_namespace(result) is nw.get_native_namespace(df)
+    compare_dicts(result, {"a": [3], "b": [4]})
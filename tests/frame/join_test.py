@@ -353,6 +353,17 @@ def test_join_keys_exceptions(constructor: Constructor, how: str) -> None:
         df.join(df, how=how, on="antananarivo", right_on="antananarivo")  # type: ignore[arg-type]
 
 
+@pytest.mark.parametrize("how", ["inner", "left", "semi", "anti", "cross"])
+def test_join_keeps_native_type(constructor: Constructor, how: str) -> None:
+    data = {"antananarivo": [1, 3, 2], "bob": [4, 4, 6], "zorro": [7.0, 8, 9]}
+    df_native = constructor(data)
+    df = nw.from_native(df_native)
+    other = df.filter(nw.col("antananarivo") > 1)
+    on = None if how == "cross" else "antananarivo"
+    result = df.join(other, how=how, on=on)  # type: ignore[arg-type]
+    assert type(nw.to_native(result)) is type(df_native)
+
+
 def test_joinasof_numeric(
     constructor: Constructor, request: pytest.FixtureRequest
 ) -> None: